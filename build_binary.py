@@ -16,20 +16,53 @@ Usage:
     python build_binary.py --upload           # Build and upload to PyPI
 """
 
+import errno
 import os
+import re
 import sys
 import shutil
-import subprocess
-import platform
-import argparse
+from functools import cache
 from pathlib import Path
 
 APP_NAME = "spreado"
 VERSION_FILE = Path("src/spreado/__init__.py")
+# Survives incremental cleans; holds data that is identical across builds
+BUILD_CACHE_DIR = Path("build") / ".cache"
+# Reused venv holding the wheel build backend, for --no-isolation builds
+BUILD_VENV_DIR = BUILD_CACHE_DIR / "venv-build"
+# Anchored so a mention of __version__ in a comment or string can't match;
+# searched in the raw bytes so the file is never decoded as a whole
+_VERSION_RE = re.compile(rb"""^__version__\s*=\s*["']([^"']+)["']""", re.M)
+
+# Checked-in PyInstaller spec: entry point, hidden imports, excludes and
+# collected packages live there so PyInstaller can reuse its analysis
+SPEC_FILE = Path(f"{APP_NAME}.spec")
+
+# Buffer for _fastcopy's userspace fallback; shutil's default is 64 KiB
+# outside Windows and staged binaries run to hundreds of MB
+_COPY_BUFSIZE = 1 << 20
+
+# Archive members that are already compressed; deflating them again
+# costs CPU for near-zero size gain
+_STORED_SUFFIXES = {".exe", ".so", ".dll", ".pyd", ".zip", ".gz"}
+
+# errno values meaning "this copy syscall can't handle these files"
+_KERNEL_COPY_UNSUPPORTED = {
+    errno.ENOSYS,
+    errno.EXDEV,
+    errno.EINVAL,
+    errno.ENOTSUP,
+    errno.EOPNOTSUPP,
+    errno.EBADF,
+    errno.EPERM,
+}
 
 
+@cache
 def get_playwright_browser_path():
     """Get Playwright browser installation path"""
+    import platform
+
     system = platform.system().lower()
 
     if system == "windows":
@@ -51,25 +84,161 @@ def find_chromium_path():
     """Find Chromium browser path in Playwright installation"""
     browser_path = get_playwright_browser_path()
 
-    if not browser_path.exists():
+    # Find chromium directory (e.g., chromium-1140, chromium-1148) with a
+    # single readdir instead of exists() + glob()
+    try:
+        with os.scandir(browser_path) as it:
+            chromium_dirs = [
+                entry.name
+                for entry in it
+                if entry.name.startswith("chromium-") and entry.is_dir()
+            ]
+    except FileNotFoundError:
         print(f"  [!] Playwright browser path not found: {browser_path}")
         return None
 
-    # Find chromium directory (e.g., chromium-1140, chromium-1148)
-    chromium_dirs = list(browser_path.glob("chromium-*"))
     if not chromium_dirs:
         print(f"  [!] No Chromium installation found in: {browser_path}")
         return None
 
     # Use the latest version
-    chromium_dir = sorted(chromium_dirs)[-1]
+    chromium_dir = browser_path / max(chromium_dirs)
     print(f"  Found Chromium: {chromium_dir.name}")
 
     return chromium_dir
 
 
+def _scan_dir(path):
+    """Sum file sizes directly under path, return (size, subdirectories)"""
+    total = 0
+    subdirs = []
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                total += entry.stat(follow_symlinks=False).st_size
+    return total, subdirs
+
+
+def _dir_size(path, max_workers=8):
+    """Get total size of a directory tree
+
+    Uses os.scandir so each file is stat'ed once from the DirEntry cache,
+    and walks subdirectories in parallel to overlap readdir latency.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    total = 0
+    pending = [str(path)]
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending:
+            next_level = []
+            for size, subdirs in executor.map(_scan_dir, pending):
+                total += size
+                next_level.extend(subdirs)
+            pending = next_level
+    return total
+
+
+def _copy_in_kernel(infd, outfd, size):
+    """Copy size bytes between file descriptors without a userspace buffer
+
+    Tries os.copy_file_range (Linux >= 5.3, reflink on CoW filesystems) then
+    os.sendfile (Linux only for file-to-file). Returns False if neither is
+    usable so the caller can fall back to a buffered copy. Raises if a
+    syscall stops partway, since the destination would be truncated.
+    """
+    candidates = []
+    if hasattr(os, "copy_file_range"):
+        candidates.append(lambda off: os.copy_file_range(infd, outfd, size - off))
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        candidates.append(lambda off: os.sendfile(outfd, infd, off, size - off))
+
+    for copy_chunk in candidates:
+        offset = 0
+        try:
+            while offset < size:
+                sent = copy_chunk(offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError as e:
+            if offset:
+                raise
+            if e.errno not in _KERNEL_COPY_UNSUPPORTED:
+                raise
+            continue
+        if offset == size:
+            return True
+        if offset:
+            raise OSError(
+                errno.EIO, f"in-kernel copy stopped at {offset} of {size} bytes"
+            )
+        # Nothing copied (e.g. a filesystem that reports 0 instead of an
+        # error); try the next syscall
+    return False
+
+
+def _fastcopy(src, dst):
+    """Copy file contents only, preferring in-kernel copy
+
+    Falls back to shutil.copyfile on macOS (fcopyfile) and otherwise to a
+    buffered loop over _COPY_BUFSIZE chunks. Metadata is not copied; callers
+    set the executable bit themselves.
+    """
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        if _copy_in_kernel(infd, outfd, os.fstat(infd).st_size):
+            return
+        if sys.platform != "darwin":
+            shutil.copyfileobj(fsrc, fdst, _COPY_BUFSIZE)
+            return
+    shutil.copyfile(src, dst)
+
+
+def _fast_copytree(src, dst):
+    """Copy a directory tree with the platform's native copy tool
+
+    robocopy (multithreaded) on Windows, ditto on macOS and cp -a on Linux
+    are all far faster than shutil.copytree for Chromium's thousands of
+    files. Symlinks are preserved; falls back to shutil.copytree when the
+    tool is missing.
+    """
+    import subprocess
+
+    src, dst = str(src), str(dst)
+    if sys.platform == "win32" and shutil.which("robocopy"):
+        cmd = [
+            "robocopy",
+            src,
+            dst,
+            "/E",
+            "/SL",
+            "/MT:32",
+            "/NFL",
+            "/NDL",
+            "/NJH",
+            "/NJS",
+            "/NP",
+        ]
+        result = subprocess.run(cmd, stdout=subprocess.DEVNULL)
+        # robocopy exit codes 0-7 mean success, 8+ mean failures
+        if result.returncode >= 8:
+            raise RuntimeError(f"robocopy failed with code {result.returncode}")
+    elif sys.platform == "darwin" and shutil.which("ditto"):
+        subprocess.run(["ditto", src, dst], check=True)
+    elif sys.platform.startswith("linux") and shutil.which("cp"):
+        os.makedirs(dst, exist_ok=True)
+        subprocess.run(["cp", "-a", os.path.join(src, "."), dst], check=True)
+    else:
+        shutil.copytree(src, dst, symlinks=True)
+
+
 def copy_chromium_to_package(temp_dir: Path):
     """Copy Chromium browser to package directory"""
+    from concurrent.futures import ThreadPoolExecutor
+
     chromium_path = find_chromium_path()
 
     if not chromium_path:
@@ -80,18 +249,44 @@ def copy_chromium_to_package(temp_dir: Path):
     browser_dest = temp_dir / "browser"
     browser_dest.mkdir(parents=True, exist_ok=True)
 
-    print("  Copying Chromium browser (this may take a while)...")
+    # The browser tree is copied once into build/.cache and re-copied only
+    # when the source directory changes
+    cache_dir = BUILD_CACHE_DIR / "browser" / chromium_path.name
+    # Stamp holds "<source mtime_ns> <tree size>" so cache hits need no walk
+    stamp_file = cache_dir.with_name(f"{chromium_path.name}.mtime")
+    source_mtime = str(chromium_path.stat().st_mtime_ns)
 
     try:
-        # Copy entire chromium directory
-        shutil.copytree(chromium_path, browser_dest / chromium_path.name, symlinks=True)
-
-        # Get size
-        total_size = sum(
-            f.stat().st_size
-            for f in (browser_dest / chromium_path.name).rglob("*")
-            if f.is_file()
-        )
+        try:
+            cached_mtime, cached_size = stamp_file.read_text().split()
+            cache_valid = cache_dir.is_dir() and cached_mtime == source_mtime
+        except (FileNotFoundError, ValueError):
+            cache_valid = False
+
+        if cache_valid:
+            total_size = int(cached_size)
+        else:
+            print("  Copying Chromium browser (this may take a while)...")
+            if cache_dir.exists():
+                shutil.rmtree(cache_dir)
+            # Size the source tree while the copy runs
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                size_future = executor.submit(_dir_size, chromium_path)
+                _fast_copytree(chromium_path, cache_dir)
+                total_size = size_future.result()
+            stamp_file.write_text(f"{source_mtime} {total_size}")
+
+        # Hardlink from the cache (one metadata update per file); fall back
+        # to a real copy when the filesystem cannot link
+        package_browser = browser_dest / chromium_path.name
+        try:
+            shutil.copytree(
+                cache_dir, package_browser, symlinks=True, copy_function=os.link
+            )
+        except OSError:
+            shutil.rmtree(package_browser, ignore_errors=True)
+            _fast_copytree(cache_dir, package_browser)
+
         size_mb = total_size / (1024 * 1024)
         print(f"  Copied Chromium browser: {size_mb:.1f} MB")
 
@@ -101,87 +296,373 @@ def copy_chromium_to_package(temp_dir: Path):
         return False
 
 
+# tarfile copies member data in 16 KiB reads by default; the package is
+# dominated by a few large binaries, so use 1 MiB chunks
+_TAR_COPY_BUFSIZE = 1 << 20
+
+
+def _archive_entries(root: Path):
+    """Lazily yield (path, arcname) for every file under root"""
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            path = os.path.join(dirpath, name)
+            yield path, os.path.relpath(path, root.parent)
+
+
+def create_archive(temp_dir: Path, output_dir: Path, use_zip=False, compression="gz"):
+    """Pack the staged package directory into a release archive
+
+    Windows packages are zipped, others use tar.gz. Executables and shared
+    libraries produced by PyInstaller are already compressed, so they are
+    stored as-is and zip members are deflated at level 1. gzip is delegated
+    to pigz when available, otherwise it runs in-process at level 1.
+    compression="zst" writes a multithreaded .tar.zst instead when zstd is
+    on PATH.
+    """
+    import subprocess
+    import tarfile
+    import zipfile
+
+    if use_zip:
+        archive_path = output_dir / f"{temp_dir.name}.zip"
+        with zipfile.ZipFile(
+            archive_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1
+        ) as zf:
+            for path, arcname in _archive_entries(temp_dir):
+                compress_type = (
+                    zipfile.ZIP_STORED
+                    if os.path.splitext(path)[1].lower() in _STORED_SUFFIXES
+                    else zipfile.ZIP_DEFLATED
+                )
+                zf.write(path, arcname, compress_type=compress_type)
+    else:
+        zstd = shutil.which("zstd") if compression == "zst" else None
+        pigz = None if zstd else shutil.which("pigz")
+        if zstd:
+            archive_path = output_dir / f"{temp_dir.name}.tar.zst"
+            compress_cmd = [zstd, "-q", "-T0"]
+        else:
+            archive_path = output_dir / f"{temp_dir.name}.tar.gz"
+            compress_cmd = [pigz, "-n", "-p", str(os.cpu_count() or 1)]
+        if zstd or pigz:
+            # Stream an uncompressed tar into the multi-core compressor
+            with open(archive_path, "wb") as out:
+                proc = subprocess.Popen(
+                    compress_cmd,
+                    stdin=subprocess.PIPE,
+                    stdout=out,
+                )
+                try:
+                    with tarfile.open(
+                        fileobj=proc.stdin, mode="w|", copybufsize=_TAR_COPY_BUFSIZE
+                    ) as tar:
+                        tar.add(temp_dir, arcname=temp_dir.name)
+                finally:
+                    proc.stdin.close()
+                    returncode = proc.wait()
+            if returncode != 0:
+                raise RuntimeError(
+                    f"{os.path.basename(compress_cmd[0])} exited with code {returncode}"
+                )
+        else:
+            with tarfile.open(
+                archive_path,
+                "w:gz",
+                compresslevel=1,
+                copybufsize=_TAR_COPY_BUFSIZE,
+            ) as tar:
+                tar.add(temp_dir, arcname=temp_dir.name)
+
+    print(f"  Created archive: {archive_path.name}")
+    return archive_path
+
+
+def run_with_log_tail(cmd, tail_lines=200, env=None, chunk_size=64 * 1024):
+    """Run a command, echoing its log output and keeping the last tail_lines
+
+    stdout and stderr are merged into one pipe drained on this thread, so
+    the child never blocks on console I/O. Output is forwarded in chunks of
+    up to chunk_size bytes as they arrive rather than line by line, and only
+    a bounded byte window is kept for the tail, so memory stays constant
+    however long the build log gets. Bytes are kept raw (the log may be
+    CP936 on Windows) and only the tail is decoded, leniently.
+    """
+    import subprocess
+
+    # Enough bytes for tail_lines of typical PyInstaller output
+    tail_bytes = tail_lines * 1024
+    tail = bytearray()
+    # Don't allocate a console window for the child on Windows
+    creationflags = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=chunk_size,
+        env=env,
+        creationflags=creationflags,
+    )
+    with proc:
+        # read1 returns whatever is available (up to chunk_size) in one call
+        for chunk in iter(lambda: proc.stdout.read1(chunk_size), b""):
+            out.write(chunk)
+            out.flush()
+            tail += chunk
+            if len(tail) > 2 * tail_bytes:
+                del tail[:-tail_bytes]
+    lines = bytes(tail).splitlines(keepends=True)[-tail_lines:]
+    return proc.returncode, b"".join(lines).decode("utf-8", "replace")
+
+
+@cache
 def get_version():
     """Get version number"""
-    if VERSION_FILE.exists():
-        content = VERSION_FILE.read_text(encoding="utf-8")
-        for line in content.split("\n"):
-            if "__version__" in line and "=" in line:
-                return line.split("=", 1)[1].strip().strip("\"'")
-    return "1.0.0"
+    try:
+        match = _VERSION_RE.search(VERSION_FILE.read_bytes())
+    except FileNotFoundError:
+        match = None
+    return match.group(1).decode("utf-8") if match else "1.0.0"
+
+
+# platform.system()/machine() (lowercased) -> build target names;
+# anything not listed is treated as linux / x64
+_OS_NAMES = {"windows": "windows", "darwin": "macos"}
+_ARCH_NAMES = {"arm64": "arm64", "aarch64": "arm64"}
+_EXE_SUFFIXES = {"windows": ".exe"}
 
 
+@cache
 def get_platform_info():
     """Get current platform info"""
+    import platform
+
     system = platform.system().lower()
     machine = platform.machine().lower()
+    return (
+        _OS_NAMES.get(system, "linux"),
+        _ARCH_NAMES.get(machine, "x64"),
+        _EXE_SUFFIXES.get(system, ""),
+    )
 
-    if system == "windows":
-        # Windows ARM64 detection
-        if machine in ("arm64", "aarch64"):
-            return "windows", "arm64", ".exe"
-        else:
-            return "windows", "x64", ".exe"
-    elif system == "darwin":
-        if machine == "arm64":
-            return "macos", "arm64", ""
-        else:
-            return "macos", "x64", ""
-    else:
-        # Linux
-        if machine in ("aarch64", "arm64"):
-            return "linux", "arm64", ""
-        else:
-            return "linux", "x64", ""
-
-
-PLATFORM_MAP = {
-    # Windows
-    ("windows", "x64"): ("windows", "x64", ".exe"),
-    ("windows", "amd64"): ("windows", "x64", ".exe"),
-    ("windows", "arm64"): ("windows", "arm64", ".exe"),
-    ("windows", "aarch64"): ("windows", "arm64", ".exe"),
-    # macOS
-    ("darwin", "x64"): ("macos", "x64", ""),
-    ("darwin", "x86_64"): ("macos", "x64", ""),
-    ("darwin", "arm64"): ("macos", "arm64", ""),
-    # Linux
-    ("linux", "x64"): ("linux", "x64", ""),
-    ("linux", "x86_64"): ("linux", "x64", ""),
-    ("linux", "aarch64"): ("linux", "arm64", ""),
-    ("linux", "arm64"): ("linux", "arm64", ""),
-}
 
+def _remove_tree_in_background(path):
+    """Rename a directory aside and delete it on a background thread
 
-def get_current_build_target():
-    """Get current platform as build target"""
-    system = platform.system().lower()
-    machine = platform.machine().lower()
+    The rename is a single metadata operation, so the path can be recreated
+    right away while the unlinks run alongside the build. The thread is not
+    a daemon: the interpreter waits for the delete to finish at exit. Falls
+    back to a synchronous rmtree when the rename fails (e.g. a file is held
+    open on Windows).
+    """
+    import threading
+    import uuid
 
-    key = (system, machine)
-    if key in PLATFORM_MAP:
-        return PLATFORM_MAP[key]
-    elif machine == "aarch64":
-        return ("linux", "arm64", "")
+    parent, name = os.path.split(os.path.normpath(path))
+    trash = os.path.join(parent, f".trash-{name}-{uuid.uuid4().hex[:8]}")
+    try:
+        os.rename(path, trash)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    threading.Thread(
+        target=shutil.rmtree, args=(trash,), kwargs={"ignore_errors": True}
+    ).start()
+
+
+def clean_build_dirs(keep_cache=False):
+    """Clean build directories
+
+    With keep_cache, build/.cache (the bundled browser copy) is preserved.
+    Directories are deleted in the background; see _remove_tree_in_background.
+    """
+    dirs_to_clean = {"build", "dist", "__pycache__"}
+    # One readdir of the project root finds both build dirs and *.spec files
+    with os.scandir(".") as it:
+        entries = list(it)
+    for entry in sorted(entries, key=lambda e: e.name):
+        if entry.name in dirs_to_clean and entry.is_dir(follow_symlinks=False):
+            if keep_cache and entry.name == "build":
+                removed = False
+                with os.scandir(entry.path) as build_it:
+                    for child in build_it:
+                        if child.name == BUILD_CACHE_DIR.name:
+                            continue
+                        if child.is_dir(follow_symlinks=False):
+                            _remove_tree_in_background(child.path)
+                        else:
+                            os.unlink(child.path)
+                        removed = True
+                # Only the cache is left: already clean
+                if not removed:
+                    continue
+            else:
+                _remove_tree_in_background(entry.path)
+            print(f"  Cleaned: {entry.name}/")
+        elif entry.name.startswith(".trash-") and entry.is_dir(follow_symlinks=False):
+            # Left behind by an interrupted run
+            _remove_tree_in_background(entry.path)
+        elif (
+            entry.name.endswith(".spec")
+            and entry.name != SPEC_FILE.name
+            and entry.is_file()
+        ):
+            os.unlink(entry.path)
+            print(f"  Cleaned: {entry.name}")
+
+
+def _artifact_key(onefile):
+    """SHA-256 over everything that determines PyInstaller's output
+
+    Content-based rather than mtime-based: a checkout or touch that leaves
+    the files unchanged still hits the cache.
+    """
+    import hashlib
+    from importlib import metadata
+
+    inputs = sorted(
+        path
+        for path in Path("src").rglob("*")
+        if path.is_file() and "__pycache__" not in path.parts
+    )
+    inputs += [SPEC_FILE, Path("pyproject.toml"), Path("uv.lock")]
+
+    digest = hashlib.sha256()
+    for path in inputs:
+        if path.is_file():
+            digest.update(path.as_posix().encode("utf-8"))
+            digest.update(path.read_bytes())
+    for dist in ("pyinstaller", "playwright", "playwright-stealth"):
+        try:
+            version = metadata.version(dist)
+        except metadata.PackageNotFoundError:
+            version = ""
+        digest.update(f"{dist}=={version}".encode("utf-8"))
+    digest.update(f"{sys.version}|{get_platform_info()}|{onefile}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _remove_path(path: Path):
+    """Remove a file or directory tree if it exists"""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    elif path.exists() or path.is_symlink():
+        path.unlink()
+
+
+def _copy_output(src: Path, dst: Path):
+    """Copy a PyInstaller output (onefile exe or onedir tree), replacing dst
+
+    Real copies rather than hardlinks: the result may later be modified in
+    place (strip, codesign), which must not leak into the cache.
+    """
+    _remove_path(dst)
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    if src.is_dir():
+        _fast_copytree(src, dst)
     else:
-        return ("linux", "x64", "")
+        _fastcopy(src, dst)
+        shutil.copymode(src, dst)
+
+
+def _prepare_build_dirs(fresh=False):
+    """Clean build output only when a fresh build is requested"""
+    # Keep the PyInstaller workpath: its own TOC/mtime checks redo only the
+    # analysis steps whose inputs changed, and unchanged inputs are already
+    # served from the content-hash artifact cache without running it
+    if fresh:
+        clean_build_dirs(keep_cache=True)
+
+
+# Package README sections; the header line is prepended per build
+_README_AUTO_DETECT = b"""
+Spreado automatically detects installed Chrome/Edge browsers.
+Just run the executable directly:
+
+  Linux/macOS:  ./spreado --help
+  Windows:      spreado.exe --help
+
+The program will show which browser is being used:
+  [Browser] Using: auto-detected: /usr/bin/google-chrome
+
+
+"""
+
+_README_MANUAL = b"""
+If auto-detection doesn't work, you can manually specify:
+
+  # Use system Chrome
+  export SPREADO_BROWSER_CHANNEL=chrome
+
+  # Or use Edge
+  export SPREADO_BROWSER_CHANNEL=msedge
+
+  # Or specify browser path directly
+  export SPREADO_BROWSER_PATH="/path/to/chrome"
+"""
 
+_README_FOOTER = b"""
 
-def clean_build_dirs():
-    """Clean build directories"""
-    dirs_to_clean = ["build", "dist", "__pycache__"]
-    for dir_name in dirs_to_clean:
-        if Path(dir_name).exists():
-            shutil.rmtree(dir_name)
-            print(f"  Cleaned: {dir_name}/")
+For more info: https://github.com/BadKid90s/Spreado
+"""
 
-    for spec_file in Path(".").glob("*.spec"):
-        spec_file.unlink()
-        print(f"  Cleaned: {spec_file.name}")
+_README_BUNDLED = (
+    b"=== Browser Auto-Detection ===\n"
+    + _README_AUTO_DETECT
+    + b"""=== Option 1: Use bundled Chromium ===
 
+Chromium browser is bundled in the 'browser' folder.
+Use the run script to use the bundled browser:
 
-def build_specific_platform(platform_name, arch, output_dir=None, onefile=True):
-    """Build binary for specific platform"""
+  Linux/macOS:  ./run.sh --help
+  Windows:      run.bat --help
+
+
+=== Option 2: Manual browser configuration ===
+"""
+    + _README_MANUAL
+    + _README_FOOTER
+)
+
+_README_SYSTEM = (
+    b"=== Browser Auto-Detection (Default) ===\n"
+    + _README_AUTO_DETECT
+    + b"=== Manual Configuration (if needed) ===\n"
+    + _README_MANUAL
+    + b"""
+  # Or install Playwright Chromium
+  playwright install chromium
+"""
+    + _README_FOOTER
+)
+
+# Run scripts pointing Playwright at the bundled browser/ folder
+_RUN_BAT = (
+    f'@echo off\nset PLAYWRIGHT_BROWSERS_PATH=%~dp0browser\n"{APP_NAME}.exe" %*\n'
+).encode("utf-8")
+
+_RUN_SH = f"""#!/bin/bash
+SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
+export PLAYWRIGHT_BROWSERS_PATH="$SCRIPT_DIR/browser"
+"$SCRIPT_DIR/{APP_NAME}" "$@"
+""".encode("utf-8")
+
+
+def build_specific_platform(
+    platform_name,
+    arch,
+    output_dir=None,
+    onefile=True,
+    archive=False,
+    fresh=False,
+):
+    """Build binary for specific platform
+
+    PyInstaller's output is cached in build/.cache/artifacts by a hash of
+    its inputs; fresh=True bypasses it.
+    """
     current_system, current_arch, current_ext = get_platform_info()
 
     if (platform_name, arch) != (current_system, current_arch):
@@ -196,218 +677,188 @@ def build_specific_platform(platform_name, arch, output_dir=None, onefile=True):
 
     pkg_name = f"{APP_NAME}-{platform_name}-{arch}"
     temp_dir = Path(f"build/{pkg_name}")
+    # Per-target PyInstaller dirs so concurrent builds never collide
+    pyinstaller_dir = Path("build") / "pyinstaller" / pkg_name
 
     print(f"\n{'='*60}")
     print(f"  Building: {platform_name} ({arch})")
     print(f"{'='*60}")
 
-    clean_build_dirs()
-
-    # Use PyInstaller directly
-    entry_point = "src/spreado/__main__.py"
+    _prepare_build_dirs(fresh)
+    if temp_dir.exists():
+        shutil.rmtree(temp_dir)
 
     build_cmd = [
         sys.executable,
         "-m",
         "PyInstaller",
-        "--name",
-        APP_NAME,
-        "--onefile" if onefile else "--onedir",
-        "--clean",
+        str(SPEC_FILE),
         "--noconfirm",
-        # Collect playwright related data
-        "--collect-all",
-        "playwright",
-        "--collect-all",
-        "playwright_stealth",
-        # Hidden imports
-        "--hidden-import",
-        "spreado.cli.cli",
-        "--hidden-import",
-        "spreado.publisher",
-        "--hidden-import",
-        "spreado.publisher.douyin_uploader",
-        "--hidden-import",
-        "spreado.publisher.xiaohongshu_uploader",
-        "--hidden-import",
-        "spreado.publisher.kuaishou_uploader",
-        "--hidden-import",
-        "spreado.publisher.shipinhao_uploader",
-        entry_point,
+        "--distpath",
+        str(pyinstaller_dir / "dist"),
+        "--workpath",
+        str(pyinstaller_dir / "work"),
     ]
+    build_env = _cache_env(SPREADO_ONEDIR="0" if onefile else "1")
 
-    print(f"\nExecuting build command: {' '.join(build_cmd)}")
+    dist_path = pyinstaller_dir / "dist"
+    exe_name = f"{APP_NAME}{current_ext}"
+    built_output = dist_path / (exe_name if onefile else APP_NAME)
 
-    result = subprocess.run(build_cmd, capture_output=False)
+    # Only the newest key is kept per target and layout
+    artifact_dir = (
+        BUILD_CACHE_DIR
+        / "artifacts"
+        / f"{pkg_name}-{'onefile' if onefile else 'onedir'}"
+    )
+    artifact_key = _artifact_key(onefile)
+    cached_output = artifact_dir / artifact_key / built_output.name
 
-    if result.returncode != 0:
-        print(f"\n[X] Build failed: {platform_name} ({arch})")
-        return False
+    if not fresh and cached_output.exists():
+        print(f"\n  Inputs unchanged, reusing cached build {artifact_key[:12]}")
+        _copy_output(cached_output, built_output)
+    else:
+        print(f"\nExecuting build command: {' '.join(build_cmd)}")
+        returncode, log_tail = run_with_log_tail(build_cmd, env=build_env)
 
-    temp_dir.mkdir(parents=True, exist_ok=True)
+        if returncode != 0:
+            print(f"\n[X] Build failed: {platform_name} ({arch})")
+            print("\n  Last lines of PyInstaller output:")
+            print(log_tail)
+            return False
 
-    dist_path = Path("dist")
-    exe_name = f"{APP_NAME}{current_ext}"
+        try:
+            _remove_path(artifact_dir)
+            _copy_output(built_output, cached_output)
+        except OSError as e:
+            print(f"  [!] Could not cache build output: {e}")
+
+    temp_dir.mkdir(parents=True, exist_ok=True)
 
     copied = False
-    for item in dist_path.iterdir():
-        if item.is_file() and (item.name == exe_name or item.suffix == ".exe"):
+    if not onefile:
+        # onedir: move the exe and its _internal/ tree into the package as-is
+        bundle_dir = dist_path / APP_NAME
+        if (bundle_dir / exe_name).is_file():
+            for item in bundle_dir.iterdir():
+                shutil.move(str(item), str(temp_dir / item.name))
+            print(f"  Moved: {bundle_dir}/ -> {temp_dir}/")
+            copied = True
+    else:
+        # One scandir pass; an exact name (or any .exe) beats a bare
+        # "spreado*" file without suffix
+        with os.scandir(dist_path) as it:
+            candidates = []
+            for entry in it:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                if entry.name == exe_name or entry.name.endswith(".exe"):
+                    candidates.append((0, entry.name, entry.path))
+                elif entry.name.startswith(APP_NAME) and "." not in entry.name:
+                    candidates.append((1, entry.name, entry.path))
+
+        if candidates:
+            _, found_name, found_path = min(candidates)
             dest_path = temp_dir / exe_name
-            shutil.copy2(item, dest_path)
-            print(f"  Copied: {item.name} -> {dest_path.name}")
+            # temp_dir sits next to PyInstaller's dist dir, so a hardlink
+            # stages the exe without moving data. Safe because PyInstaller
+            # removes its output before rebuilding rather than rewriting it
+            try:
+                os.link(found_path, dest_path)
+            except OSError:
+                _fastcopy(found_path, dest_path)
+            print(f"  Staged: {found_name} -> {dest_path.name}")
             if current_ext != ".exe":
                 os.chmod(dest_path, 0o755)
             copied = True
-            break
-
-    if not copied:
-        for item in dist_path.iterdir():
-            if item.is_file() and item.name.startswith(APP_NAME) and not item.suffix:
-                dest_path = temp_dir / exe_name
-                shutil.copy2(item, dest_path)
-                print(f"  Copied: {item.name} -> {dest_path.name}")
-                os.chmod(dest_path, 0o755)
-                copied = True
-                break
 
     if not copied:
         print("\n[X] Error: Executable not found")
         return False
 
-    # Copy Chromium browser to package
-    print("\n  Bundling Chromium browser...")
-    browser_bundled = copy_chromium_to_package(temp_dir)
-
-    # Create README.txt
-    if browser_bundled:
-        readme_content = f"""Spreado v{get_version()} - {platform_name} ({arch})
-
-=== Browser Auto-Detection ===
-
-Spreado automatically detects installed Chrome/Edge browsers.
-Just run the executable directly:
-
-  Linux/macOS:  ./spreado --help
-  Windows:      spreado.exe --help
-
-The program will show which browser is being used:
-  [Browser] Using: auto-detected: /usr/bin/google-chrome
-
-
-=== Option 1: Use bundled Chromium ===
-
-Chromium browser is bundled in the 'browser' folder.
-Use the run script to use the bundled browser:
-
-  Linux/macOS:  ./run.sh --help
-  Windows:      run.bat --help
-
-
-=== Option 2: Manual browser configuration ===
-
-If auto-detection doesn't work, you can manually specify:
-
-  # Use system Chrome
-  export SPREADO_BROWSER_CHANNEL=chrome
-
-  # Or use Edge
-  export SPREADO_BROWSER_CHANNEL=msedge
-
-  # Or specify browser path directly
-  export SPREADO_BROWSER_PATH="/path/to/chrome"
-
-
-For more info: https://github.com/BadKid90s/Spreado
-"""
-    else:
-        readme_content = f"""Spreado v{get_version()} - {platform_name} ({arch})
-
-=== Browser Auto-Detection (Default) ===
-
-Spreado automatically detects installed Chrome/Edge browsers.
-Just run the executable directly:
-
-  Linux/macOS:  ./spreado --help
-  Windows:      spreado.exe --help
-
-The program will show which browser is being used:
-  [Browser] Using: auto-detected: /usr/bin/google-chrome
-
-
-=== Manual Configuration (if needed) ===
-
-If auto-detection doesn't work, you can manually specify:
-
-  # Use system Chrome
-  export SPREADO_BROWSER_CHANNEL=chrome
-
-  # Or use Edge  
-  export SPREADO_BROWSER_CHANNEL=msedge
-
-  # Or specify browser path directly
-  export SPREADO_BROWSER_PATH="/path/to/chrome"
-
-  # Or install Playwright Chromium
-  playwright install chromium
-
-
-For more info: https://github.com/BadKid90s/Spreado
-"""
-    readme_path = temp_dir / "README.txt"
-    readme_path.write_text(readme_content, encoding="utf-8")
-    print("  Created: README.txt")
-
-    # Create run script (with browser path set)
-    if browser_bundled:
-        if platform.system() == "Windows":
-            run_script = temp_dir / "run.bat"
-            run_content = f'@echo off\nset PLAYWRIGHT_BROWSERS_PATH=%~dp0browser\n"{APP_NAME}.exe" %*\n'
-            run_script.write_text(run_content, encoding="utf-8")
-            print("  Created: run.bat")
-        else:
-            run_script = temp_dir / "run.sh"
-            run_content = f"""#!/bin/bash
-SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
-export PLAYWRIGHT_BROWSERS_PATH="$SCRIPT_DIR/browser"
-"$SCRIPT_DIR/{APP_NAME}" "$@"
-"""
-            run_script.write_text(run_content, encoding="utf-8")
-            os.chmod(run_script, 0o755)
-            print("  Created: run.sh")
+    # A bare onefile build ships only the exe; the browser, README and run
+    # script are only kept by an archive or a onedir package
+    if archive or not onefile:
+        # Copy Chromium browser to package
+        print("\n  Bundling Chromium browser...")
+        browser_bundled = copy_chromium_to_package(temp_dir)
+
+        # Create README.txt
+        readme_header = f"Spreado v{get_version()} - {platform_name} ({arch})\n\n"
+        readme_path = temp_dir / "README.txt"
+        readme_path.write_bytes(
+            readme_header.encode("utf-8")
+            + (_README_BUNDLED if browser_bundled else _README_SYSTEM)
+        )
+        print("  Created: README.txt")
+
+        # Create run script (with browser path set)
+        if browser_bundled:
+            if current_system == "windows":
+                run_script = temp_dir / "run.bat"
+                run_script.write_bytes(_RUN_BAT)
+                print("  Created: run.bat")
+            else:
+                run_script = temp_dir / "run.sh"
+                # Create with the final mode instead of write + chmod
+                fd = os.open(run_script, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_RUN_SH)
+                print("  Created: run.sh")
 
     # Ensure output directory exists
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # Define final executable name without version
-    final_exe_name = f"{APP_NAME}-{platform_name}-{arch}{current_ext}"
-    final_output = output_dir / final_exe_name
-
-    print(f"\n  Finalizing: {final_exe_name}")
-
-    if final_output.exists():
-        final_output.unlink()
+    if onefile:
+        # Define final executable name without version
+        final_output = output_dir / f"{APP_NAME}-{platform_name}-{arch}{current_ext}"
+        print(f"\n  Finalizing: {final_output.name}")
+    else:
+        # onedir: the whole package directory is the output
+        final_output = output_dir / pkg_name
+        print(f"\n  Finalizing: {final_output.name}/")
+
+    # Pack before the staged files are moved out of temp_dir
+    if archive:
+        create_archive(
+            temp_dir,
+            output_dir,
+            use_zip=current_ext == ".exe",
+            compression="zst" if archive == "zst" else "gz",
+        )
 
-    # Copy the executable from temp_dir to dist/
-    exe_in_temp = temp_dir / exe_name
-    shutil.copy2(exe_in_temp, final_output)
+    # dist/ survives incremental builds and may hold the other layout's output
+    _remove_path(final_output)
 
-    if current_ext != ".exe":
-        os.chmod(final_output, 0o755)
+    if onefile:
+        exe_in_temp = temp_dir / exe_name
+        if os.stat(exe_in_temp).st_dev == os.stat(output_dir).st_dev:
+            # Same filesystem: a rename only updates the directory entry
+            os.replace(exe_in_temp, final_output)
+        else:
+            _fastcopy(exe_in_temp, final_output)
+            if current_ext != ".exe":
+                os.chmod(final_output, 0o755)
+        shutil.rmtree(temp_dir)
+    else:
+        # Renames when on the same filesystem, copies otherwise
+        shutil.move(str(temp_dir), str(final_output))
 
-    shutil.rmtree(temp_dir)
     print(f"\n[OK] {platform_name} ({arch}) build completed")
     print(f"  Output: {final_output}")
 
     return final_output
 
 
-def build_current_platform():
+def build_current_platform(archive=False, onefile=True, fresh=False):
     """Build binary for current platform"""
     system, machine, exe_ext = get_platform_info()
-    return build_specific_platform(system, machine)
+    return build_specific_platform(
+        system, machine, onefile=onefile, archive=archive, fresh=fresh
+    )
 
 
-def build_all_platforms():
+def build_all_platforms(archive=False, onefile=True, fresh=False):
     """Build binaries for all platforms"""
     platforms = [
         ("windows", "x64"),
@@ -418,14 +869,27 @@ def build_all_platforms():
         ("linux", "arm64"),
     ]
 
-    results = []
-    for platform_name, arch in platforms:
+    current_system, current_arch, _ = get_platform_info()
+
+    # Cross-platform targets are recorded as skipped without a build attempt
+    runnable = [
+        target for target in platforms if target == (current_system, current_arch)
+    ]
+    outcomes = {target: None for target in platforms if target not in runnable}
+    if outcomes:
+        skipped_names = ", ".join(f"{p}-{a}" for p, a in outcomes)
+        print(f"\n[!] Skip cross-platform builds: {skipped_names}")
+
+    for platform_name, arch in runnable:
         try:
-            result = build_specific_platform(platform_name, arch)
-            results.append((platform_name, arch, result))
+            outcomes[(platform_name, arch)] = build_specific_platform(
+                platform_name, arch, onefile=onefile, archive=archive, fresh=fresh
+            )
         except Exception as e:
             print(f"\n[X] Build failed {platform_name} ({arch}): {e}")
-            results.append((platform_name, arch, None))
+            outcomes[(platform_name, arch)] = False
+
+    results = [(p, a, outcomes[(p, a)]) for p, a in platforms]
 
     print(f"\n{'='*60}")
     print("  Build Summary")
@@ -445,7 +909,7 @@ def build_all_platforms():
 
     print(f"\n  Total: {succeeded} succeeded, {failed} failed, {skipped} skipped")
     print(
-        f"\n  Note: On {platform.system()}-{platform.machine()}, only current platform binary can be built"
+        f"\n  Note: On {current_system}-{current_arch}, only current platform binary can be built"
     )
     print("        To build for other platforms, run this script on the target OS")
 
@@ -454,6 +918,8 @@ def build_all_platforms():
 
 def upload_to_pypi(test=True):
     """Upload to PyPI"""
+    import subprocess
+
     print(f"\n{'='*60}")
     print("  Preparing to upload to PyPI")
     print(f"{'='*60}")
@@ -478,14 +944,81 @@ def upload_to_pypi(test=True):
     return result.returncode == 0
 
 
+def _cache_env(**extra):
+    """Environment for build subprocesses, with download caches in build/.cache
+
+    PYTHONHASHSEED is pinned (unless already set) so set/dict iteration
+    order inside PyInstaller's analysis is the same on every run, making
+    identical inputs produce identical binaries.
+    """
+    cache_root = os.path.abspath(BUILD_CACHE_DIR)
+    return dict(
+        os.environ,
+        PIP_CACHE_DIR=os.path.join(cache_root, "pip"),
+        PYINSTALLER_CONFIG_DIR=os.path.join(cache_root, "pyinstaller"),
+        PYTHONHASHSEED=os.environ.get("PYTHONHASHSEED", "0"),
+        **extra,
+    )
+
+
+def _ensure_build_venv():
+    """Create or reuse a venv with the pyproject build requirements installed
+
+    The venv is keyed by a hash of pyproject.toml and rebuilt when it changes.
+    Returns the venv's python, or None if it could not be set up.
+    """
+    import hashlib
+    import subprocess
+
+    pyproject = Path("pyproject.toml").read_bytes()
+    digest = hashlib.sha256(pyproject).hexdigest()
+    stamp_file = BUILD_VENV_DIR / "pyproject.sha256"
+    if sys.platform == "win32":
+        python = BUILD_VENV_DIR / "Scripts" / "python.exe"
+    else:
+        python = BUILD_VENV_DIR / "bin" / "python"
+
+    try:
+        if python.exists() and stamp_file.read_text() == digest:
+            return python
+    except FileNotFoundError:
+        pass
+
+    match = re.search(rb"^requires\s*=\s*\[(.*?)\]", pyproject, re.M | re.S)
+    requires = re.findall(rb"[\"']([^\"']+)[\"']", match.group(1)) if match else []
+
+    if BUILD_VENV_DIR.exists():
+        shutil.rmtree(BUILD_VENV_DIR)
+    print("  Creating build venv (reused by later runs)...")
+    env = _cache_env()
+    steps = [
+        [sys.executable, "-m", "venv", str(BUILD_VENV_DIR)],
+        [str(python), "-m", "pip", "install", "--quiet", "build"]
+        + [req.decode() for req in requires],
+    ]
+    for step in steps:
+        if subprocess.run(step, env=env).returncode != 0:
+            shutil.rmtree(BUILD_VENV_DIR, ignore_errors=True)
+            return None
+    stamp_file.write_text(digest)
+    return python
+
+
 def create_wheels_for_pypi():
     """Create wheel files for PyPI"""
+    import subprocess
+
     print(f"\n{'='*60}")
     print("  Creating Python Wheel files")
     print(f"{'='*60}")
 
-    build_cmd = [sys.executable, "-m", "build", "--wheel"]
-    result = subprocess.run(build_cmd)
+    # Build in the cached venv instead of a fresh isolated one per run
+    build_python = _ensure_build_venv()
+    if build_python:
+        build_cmd = [str(build_python), "-m", "build", "--wheel", "--no-isolation"]
+    else:
+        build_cmd = [sys.executable, "-m", "build", "--wheel"]
+    result = subprocess.run(build_cmd, env=_cache_env())
 
     if result.returncode == 0:
         print("\n[OK] Wheel files created successfully")
@@ -498,7 +1031,22 @@ def create_wheels_for_pypi():
     return result.returncode == 0
 
 
+def _print_banner():
+    print(f"\n{'='*60}")
+    print(f"  Spreado Binary Build Tool v{get_version()}")
+    print(f"{'='*60}")
+
+
 def main():
+    # Fast path: a bare --clean needs neither argparse nor the build helpers
+    if sys.argv[1:] == ["--clean"]:
+        _print_banner()
+        clean_build_dirs()
+        print("\n[OK] Clean completed")
+        return 0
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Spreado Binary Build Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -506,6 +1054,10 @@ def main():
 Examples:
   python build_binary.py              # Build for current platform
   python build_binary.py --all        # Build for all platforms
+  python build_binary.py --archive    # Also pack README/browser into an archive
+  python build_binary.py --archive zst  # Same, as .tar.zst when zstd is installed
+  python build_binary.py --onedir     # Directory bundle, no extraction at launch
+  python build_binary.py --fresh      # Discard build cache and rebuild from scratch
   python build_binary.py --upload     # Upload to PyPI (test)
   python build_binary.py --release    # Full release workflow
         """,
@@ -514,6 +1066,24 @@ Examples:
     parser.add_argument(
         "--all", action="store_true", help="Build binaries for all platforms"
     )
+    parser.add_argument(
+        "--archive",
+        nargs="?",
+        const="gz",
+        choices=["gz", "zst"],
+        help="Also pack the full package (README, run script, browser) into "
+        ".tar.gz/.zip; 'zst' writes .tar.zst when zstd is installed",
+    )
+    parser.add_argument(
+        "--onedir",
+        action="store_true",
+        help="Build a onedir bundle instead of a single file (faster startup)",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Clean build directories before building (disables incremental builds)",
+    )
     parser.add_argument(
         "--upload", action="store_true", help="Upload to PyPI (test environment)"
     )
@@ -531,10 +1101,7 @@ Examples:
 
     args = parser.parse_args()
 
-    version = get_version()
-    print(f"\n{'='*60}")
-    print(f"  Spreado Binary Build Tool v{version}")
-    print(f"{'='*60}")
+    _print_banner()
 
     if args.clean:
         clean_build_dirs()
@@ -555,9 +1122,13 @@ Examples:
         return 0
 
     if args.all:
-        success = build_all_platforms()
+        success = build_all_platforms(
+            archive=args.archive, onefile=not args.onedir, fresh=args.fresh
+        )
     else:
-        success = build_current_platform()
+        success = build_current_platform(
+            archive=args.archive, onefile=not args.onedir, fresh=args.fresh
+        )
 
     if args.upload:
         upload_to_pypi(test=True)
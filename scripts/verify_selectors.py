@@ -130,14 +130,14 @@ async def verify_platform(
     else:
         inst = cls()
 
-    async with await StealthBrowser.create(headless=headless) as browser:
+    async with StealthBrowser(headless=headless) as browser:
         login_result = await _verify_page(
             browser, inst.login_url, inst._login_selectors
         )
 
     publish_result: Optional[PageResult] = None
     if inst.cookie_file_path.exists():
-        async with await StealthBrowser.create(headless=headless) as browser:
+        async with StealthBrowser(headless=headless) as browser:
             await browser.load_cookies_from_file(inst.cookie_file_path)
             publish_result = await _verify_page(
                 browser, inst.publish_url, inst._authed_selectors
@@ -0,0 +1,123 @@
+# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller spec for the spreado binary, used by build_binary.py
+#
+# Set SPREADO_ONEDIR=1 to build a onedir bundle instead of a single file.
+import os
+import sys
+
+from PyInstaller.utils.hooks import collect_all
+
+ONEDIR = os.environ.get("SPREADO_ONEDIR") == "1"
+
+# Strip debug symbols from collected binaries (not supported on Windows).
+# UPX stays off: playwright's payload is already compressed and UPX'd
+# binaries must be decompressed again on every launch
+STRIP = sys.platform != "win32"
+
+# Modules PyInstaller cannot see statically: plugins are imported by name
+# from PluginLoader._BUILTIN_MODULES
+hiddenimports = [
+    "spreado.cli.cli",
+    "spreado.plugins.douyin.uploader",
+    "spreado.plugins.xiaohongshu.uploader",
+    "spreado.plugins.kuaishou.uploader",
+    "spreado.plugins.shipinhao.uploader",
+]
+
+# Stdlib packages never imported by the CLI/Playwright stack; excluding them
+# shrinks the PYZ that the onefile bootloader extracts on every launch
+excludes = [
+    "tkinter",
+    "turtle",
+    "idlelib",
+    "unittest",
+    "test",
+    "doctest",
+    "pydoc",
+    "pdb",
+    "lib2to3",
+    "ensurepip",
+    "distutils",
+    "setuptools",
+    "pip",
+    "email.mime",
+    "xml.dom",
+    "xmlrpc",
+    "http.server",
+]
+
+# Collect playwright related data
+datas = []
+binaries = []
+for package in ("playwright", "playwright_stealth"):
+    package_datas, package_binaries, package_hiddenimports = collect_all(package)
+    datas += package_datas
+    binaries += package_binaries
+    hiddenimports += package_hiddenimports
+
+a = Analysis(
+    [os.path.join(SPECPATH, "src", "spreado", "__main__.py")],
+    pathex=[],
+    binaries=binaries,
+    datas=datas,
+    hiddenimports=hiddenimports,
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=excludes,
+    noarchive=False,
+    # Compile bundled modules at -OO: strips asserts and docstrings,
+    # shrinking the PYZ. Nothing in spreado or playwright reads __doc__
+    optimize=2,
+)
+pyz = PYZ(a.pure)
+
+if ONEDIR:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        [("O", None, "OPTION"), ("O", None, "OPTION")],
+        exclude_binaries=True,
+        name="spreado",
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=STRIP,
+        upx=False,
+        console=True,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=STRIP,
+        upx=False,
+        upx_exclude=[],
+        name="spreado",
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [("O", None, "OPTION"), ("O", None, "OPTION")],
+        name="spreado",
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=STRIP,
+        upx=False,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=True,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
@@ -47,6 +47,17 @@ def _get_platform_choices(include_all: bool = False) -> List[str]:
     return names
 
 
+async def _gather_limited(coros, limit: int) -> list:
+    """并发执行协程，同时运行的数量不超过 limit（避免同时启动过多浏览器）"""
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(run(c) for c in coros), return_exceptions=True)
+
+
 def get_publisher(platform: str, cookies: str = None, headless: bool = True):
     """获取发布器实例"""
     loader = get_plugin_loader()
@@ -148,7 +159,7 @@ async def cmd_verify(args):
 
     if args.parallel and len(platforms) > 1:
         tasks = [verify_single_platform(p, args, logger) for p in platforms]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await _gather_limited(tasks, args.jobs)
         success_count = sum(1 for r in results if r is True)
         fail_count = len(results) - success_count
     else:
@@ -283,7 +294,7 @@ async def cmd_upload(args):
             )
             for p in platforms
         ]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await _gather_limited(tasks, args.jobs)
         success_count = sum(1 for r in results if r is True)
         fail_count = len(results) - success_count
     else:
@@ -396,7 +407,11 @@ def create_parser():
     verify_parser = subparsers.add_parser(
         "verify",
         help="验证 Cookie 是否有效",
-        description="验证指定平台的 Cookie 是否有效",
+        description=(
+            "验证指定平台的 Cookie 是否有效。"
+            "验证通过后 5 分钟内 Cookie 文件未变化则直接视为有效，"
+            "期间在服务端退出登录不会被检测到"
+        ),
     )
     verify_parser.add_argument(
         "platform",
@@ -407,6 +422,9 @@ def create_parser():
     verify_parser.add_argument(
         "--parallel", "-p", action="store_true", help="并行验证多个平台"
     )
+    verify_parser.add_argument(
+        "--jobs", "-j", type=int, default=4, help="并行模式下同时验证的平台数 (默认 4)"
+    )
     verify_parser.add_argument("--debug", action="store_true", help="调试模式")
     verify_parser.set_defaults(func=cmd_verify)
 
@@ -440,6 +458,9 @@ def create_parser():
     upload_parser.add_argument(
         "--parallel", "-p", action="store_true", help="并行上传到多个平台"
     )
+    upload_parser.add_argument(
+        "--jobs", "-j", type=int, default=4, help="并行模式下同时上传的平台数 (默认 4)"
+    )
     upload_parser.add_argument("--debug", action="store_true", help="调试模式")
     upload_parser.set_defaults(func=cmd_upload)
 
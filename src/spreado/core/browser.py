@@ -1,5 +1,7 @@
+import asyncio
 import os
 import platform
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Literal
 
@@ -40,9 +42,61 @@ BROWSER_PATHS = {
 }
 
 
+# stealth 配置与上下文无关，构建一次供所有浏览器上下文复用
+_STEALTH = Stealth(navigator_languages_override=("zh-CN", "zh"), init_scripts_only=True)
+
+
+class _SharedPlaywright:
+    """
+    进程内共享的 Playwright 驱动（引用计数）
+
+    每次 async_playwright().start() 都会启动一个 Node 驱动子进程。
+    并行处理多个平台时，各 StealthBrowser 共用同一个驱动，只各自启动浏览器；
+    最后一个使用者释放时停止驱动。驱动绑定在事件循环上，循环变化时重新启动。
+    """
+
+    def __init__(self):
+        self._playwright: Optional[Playwright] = None
+        self._refs = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 旧循环上的驱动已不可用，丢弃
+            self._lock = asyncio.Lock()
+            self._loop = loop
+            self._playwright = None
+            self._refs = 0
+        return self._lock
+
+    async def acquire(self) -> Playwright:
+        async with self._get_lock():
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._refs += 1
+            return self._playwright
+
+    async def release(self) -> None:
+        async with self._get_lock():
+            self._refs -= 1
+            if self._refs <= 0 and self._playwright is not None:
+                playwright, self._playwright = self._playwright, None
+                self._refs = 0
+                await playwright.stop()
+
+
+_shared_playwright = _SharedPlaywright()
+
+# 已输出过的浏览器来源，同一来源每个进程只提示一次
+_announced_sources: set = set()
+
+
+@lru_cache(maxsize=1)
 def _detect_system_browser() -> Optional[str]:
     """
-    自动检测系统已安装的浏览器
+    自动检测系统已安装的浏览器（每个进程只探测一次）
 
     Returns:
         浏览器可执行文件路径，未找到返回 None
@@ -142,8 +196,19 @@ class StealthBrowser:
         return config, "Playwright built-in Chromium"
 
     async def __aenter__(self):
-        self.playwright = await async_playwright().start()
+        # create() 已进入过时直接返回，避免重复获取驱动引用、重复启动浏览器
+        if self.playwright is not None:
+            return self
+        self.playwright = await _shared_playwright.acquire()
+        try:
+            await self._launch()
+        except BaseException:
+            # 启动失败也要释放驱动引用，否则共享驱动无法停止
+            await self.__aexit__(None, None, None)
+            raise
+        return self
 
+    async def _launch(self) -> None:
         args = [
             "--disable-blink-features=AutomationControlled",
             "--no-sandbox",
@@ -153,7 +218,9 @@ class StealthBrowser:
 
         # 获取浏览器配置
         browser_config, browser_source = self._get_browser_config()
-        print(f"[Browser] Using: {browser_source}")
+        if browser_source not in _announced_sources:
+            _announced_sources.add(browser_source)
+            print(f"[Browser] Using: {browser_source}")
 
         self.browser = await self.playwright.chromium.launch(
             headless=self.headless,
@@ -165,12 +232,7 @@ class StealthBrowser:
             no_viewport=True, ignore_https_errors=True
         )
 
-        stealth = Stealth(
-            navigator_languages_override=("zh-CN", "zh"), init_scripts_only=True
-        )
-        await stealth.apply_stealth_async(self.context)
-
-        return self
+        await _STEALTH.apply_stealth_async(self.context)
 
     async def new_page(self) -> Page:
         if not self.context:
@@ -239,8 +301,8 @@ class StealthBrowser:
             await self.browser.close()
             self.browser = None
         if self.playwright:
-            await self.playwright.stop()
             self.playwright = None
+            await _shared_playwright.release()
 
 
 # ==========================================
@@ -4,6 +4,7 @@
 - 公共流程：login_flow / verify_cookie_flow / upload_video_flow
 - 通用工具：_find_first_element / _click_first_visible / _upload_file_to_first
             _wait_for_condition / _wait_until_attached / _click_and_wait_for_url
+            _goto_with_retry
 - 登录检测：cookie 文件过期预检 + positive DOM + negative DOM 兜底
 """
 
@@ -14,12 +15,15 @@ import json
 import re
 import time
 from abc import ABC, abstractmethod
+from contextlib import AsyncExitStack
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional
 from urllib.parse import urlparse
 
 from playwright.async_api import Error, Locator, Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from ..conf import COOKIES_DIR
 from ..utils.log import StepLogger, get_uploader_logger
@@ -27,6 +31,18 @@ from .browser import StealthBrowser
 
 WaitState = Literal["visible", "attached", "hidden", "detached"]
 
+# cookie 验证通过后的缓存有效期（秒），缓存写在 cookie 旁的 .verified 文件中
+_VERIFY_CACHE_TTL = 300
+
+# 页面跳转遇到超时/网络错误时的最大尝试次数，间隔按 1s、2s… 指数退避
+_GOTO_ATTEMPTS = 3
+
+
+@lru_cache(maxsize=None)
+def _default_cookie_file(platform_name: str) -> Path:
+    """平台默认的 Cookie 文件路径，按平台缓存，避免每次实例化都重新拼接 Path。"""
+    return COOKIES_DIR / f"{platform_name}_uploader" / "account.json"
+
 
 class BaseUploader(ABC):
     """所有平台上传器的基类，定义通用流程与可复用工具方法。"""
@@ -42,9 +58,7 @@ class BaseUploader(ABC):
     ):
         self.logger = logger or get_uploader_logger(self.platform_name)
         if cookie_file_path is None:
-            self.cookie_file_path = (
-                COOKIES_DIR / f"{self.platform_name}_uploader" / "account.json"
-            )
+            self.cookie_file_path = _default_cookie_file(self.platform_name)
         else:
             self.cookie_file_path = Path(cookie_file_path)
         self._headless = headless
@@ -110,7 +124,7 @@ class BaseUploader(ABC):
     async def login_flow(self) -> bool:
         try:
             with self.logger.step("login_flow", platform=self.platform_name):
-                async with await StealthBrowser.create(
+                async with StealthBrowser(
                     headless=False, channel=self._browser_channel
                 ) as browser:
                     page = await browser.new_page()
@@ -154,14 +168,8 @@ class BaseUploader(ABC):
             if cur_url.startswith(("chrome-error://", "edge://")):
                 return False
             # positive 检测：authed 元素出现
-            if self._authed_selectors:
-                for sel in self._authed_selectors:
-                    try:
-                        el = page.locator(sel)
-                        if await el.count() > 0 and await el.first.is_visible():
-                            return True
-                    except Error:
-                        continue
+            if await self._any_visible(page, self._authed_selectors):
+                return True
             # negative 检测：登录表单仍存在 → 继续等待
             if await self._check_login_required(page):
                 _no_login_since = 0.0
@@ -186,11 +194,28 @@ class BaseUploader(ABC):
             _no_login_since = 0.0
             return False
 
-        return await self._wait_for_condition(
-            check, timeout=timeout, interval=2.0, desc="login"
-        )
+        # 主框架导航（登录后跳转）时立即检测，DOM 变化仍靠 interval 兜底
+        navigated = asyncio.Event()
+
+        def on_navigated(frame) -> None:
+            if frame is page.main_frame:
+                navigated.set()
 
-    async def verify_cookie_flow(self, auto_login: bool = False) -> bool:
+        page.on("framenavigated", on_navigated)
+        try:
+            return await self._wait_for_condition(
+                check, timeout=timeout, interval=2.0, desc="login", wake=navigated
+            )
+        finally:
+            page.remove_listener("framenavigated", on_navigated)
+
+    async def verify_cookie_flow(
+        self, auto_login: bool = False, browser: Optional[StealthBrowser] = None
+    ) -> bool:
+        """验证 cookie，失效且 auto_login 时进入登录流程。
+
+        browser: 已加载 cookie 的浏览器，传入时在其中验证，不再单独启动浏览器。
+        """
         if not self.cookie_file_path.exists():
             self.logger.warning("cookie 文件不存在", path=str(self.cookie_file_path))
             return await self.login_flow() if auto_login else False
@@ -199,7 +224,12 @@ class BaseUploader(ABC):
             self.logger.warning("cookie 文件已过期（本地预检）")
             return await self.login_flow() if auto_login else False
 
-        if await self._verify_cookie():
+        if self._is_cookie_recently_verified():
+            self.logger.info("cookie 有效", method="verify_cache")
+            return True
+
+        if await self._verify_cookie(browser):
+            self._mark_cookie_verified()
             return True
         return await self.login_flow() if auto_login else False
 
@@ -215,16 +245,36 @@ class BaseUploader(ABC):
     ) -> bool:
         try:
             with self.logger.step("upload_video_flow", title=title) as step:
-                cookie_ok = await self.verify_cookie_flow(auto_login=auto_login)
-                if cookie_ok:
-                    # cookie 有效，使用浏览器上传
+                async with AsyncExitStack() as stack:
                     headless = self._headless_upload
-                    async with await StealthBrowser.create(
-                        headless=headless
-                    ) as browser:
+                    browser: Optional[StealthBrowser] = None
+                    if (
+                        headless
+                        and self.cookie_file_path.exists()
+                        and not self._is_cookie_file_expired()
+                    ):
+                        # 无头上传与 cookie 验证使用同一种浏览器，共用一个实例，
+                        # 省去一次浏览器冷启动
+                        browser = await StealthBrowser.create(headless=True)
+                        stack.push_async_exit(browser.__aexit__)
                         await browser.load_cookies_from_file(self.cookie_file_path)
+
+                    cookie_ok = await self.verify_cookie_flow(browser=browser)
+                    if not cookie_ok:
+                        # 先关闭验证用的浏览器，再按需登录
+                        await stack.aclose()
+                        browser = None
+                        if auto_login:
+                            cookie_ok = await self.login_flow()
+
+                    if cookie_ok:
+                        # cookie 有效，使用浏览器上传
+                        if browser is None:
+                            browser = await StealthBrowser.create(headless=headless)
+                            stack.push_async_exit(browser.__aexit__)
+                            await browser.load_cookies_from_file(self.cookie_file_path)
                         async with await browser.new_page() as page:
-                            await page.goto(self.publish_url)
+                            await self._goto_with_retry(page, self.publish_url)
                             ok = await self._upload_video(
                                 page=page,
                                 file_path=file_path,
@@ -236,20 +286,20 @@ class BaseUploader(ABC):
                             )
                             step.add_field(result="success" if ok else "failure")
                             return ok
-                elif auto_login:
-                    # cookie 无效 + auto_login：在同一个浏览器中登录并上传
-                    # （解决跨浏览器 fingerprint 不兼容问题，如快手）
-                    self.logger.info("cookie 无效，启动登录流程（同一浏览器）")
-                    return await self._login_and_upload(
-                        file_path=file_path,
-                        title=title,
-                        content=content,
-                        tags=tags,
-                        publish_date=publish_date,
-                        thumbnail_path=thumbnail_path,
-                    )
-                else:
-                    raise RuntimeError("cookie 无效")
+                    elif auto_login:
+                        # cookie 无效 + auto_login：在同一个浏览器中登录并上传
+                        # （解决跨浏览器 fingerprint 不兼容问题，如快手）
+                        self.logger.info("cookie 无效，启动登录流程（同一浏览器）")
+                        return await self._login_and_upload(
+                            file_path=file_path,
+                            title=title,
+                            content=content,
+                            tags=tags,
+                            publish_date=publish_date,
+                            thumbnail_path=thumbnail_path,
+                        )
+                    else:
+                        raise RuntimeError("cookie 无效")
         except Exception as e:
             self.logger.error("上传流程异常", reason=str(e)[:200])
             return False
@@ -266,7 +316,7 @@ class BaseUploader(ABC):
         """在同一个浏览器中完成登录 + 上传（解决 fingerprint 不兼容问题）。"""
         try:
             with self.logger.step("login_and_upload"):
-                async with await StealthBrowser.create(
+                async with StealthBrowser(
                     headless=False, channel=self._browser_channel
                 ) as browser:
                     # 1) 登录
@@ -327,16 +377,67 @@ class BaseUploader(ABC):
                 return False
         return True
 
+    @property
+    def _verify_cache_file(self) -> Path:
+        return self.cookie_file_path.with_name(self.cookie_file_path.name + ".verified")
+
+    def _is_cookie_recently_verified(self) -> bool:
+        """cookie 文件未变化且 _VERIFY_CACHE_TTL 内验证通过过 → True。
+
+        缓存以 cookie 的 mtime_ns + size 为键，重新登录写入 cookie 后自动失效，
+        避免连续执行 verify / upload 时重复启动浏览器验证。
+        """
+        try:
+            st = self.cookie_file_path.stat()
+            data = json.loads(self._verify_cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+        # 缓存文件内容不合法（被改写/截断）时视为未验证
+        if not isinstance(data, dict):
+            return False
+        ts = data.get("ts")
+        if isinstance(ts, bool) or not isinstance(ts, (int, float)):
+            return False
+        return (
+            data.get("mtime_ns") == st.st_mtime_ns
+            and data.get("size") == st.st_size
+            and 0 <= time.time() - ts < _VERIFY_CACHE_TTL
+        )
+
+    def _mark_cookie_verified(self) -> None:
+        """记录本次验证通过的 cookie 状态，写入失败不影响主流程。"""
+        try:
+            st = self.cookie_file_path.stat()
+            self._verify_cache_file.write_text(
+                json.dumps(
+                    {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "ts": time.time()}
+                ),
+                encoding="utf-8",
+            )
+        except OSError as e:
+            self.logger.debug("写入验证缓存失败", reason=str(e)[:100])
+
     async def _check_login_required(self, page: Page) -> bool:
         """negative 检测：登录页特征元素是否可见。"""
-        for selector in self._login_selectors:
+        return await self._any_visible(page, self._login_selectors)
+
+    @staticmethod
+    async def _any_visible(page: Page, selectors: List[str]) -> bool:
+        """并发探测多个选择器，任一元素可见即返回 True。
+
+        is_visible() 对不存在的元素直接返回 False，无需先 count()；
+        各探测并发执行，N 个选择器只需约一次往返。
+        """
+        if not selectors:
+            return False
+
+        async def probe(selector: str) -> bool:
             try:
-                el = page.locator(selector)
-                if await el.count() > 0 and await el.first.is_visible():
-                    return True
+                return await page.locator(selector).first.is_visible()
             except Error:
-                continue
-        return False
+                return False
+
+        return any(await asyncio.gather(*(probe(sel) for sel in selectors)))
 
     async def _check_authed(self, page: Page, timeout: int = 8000) -> Optional[bool]:
         """positive 检测：等待任一登录后特征元素出现。
@@ -357,43 +458,51 @@ class BaseUploader(ABC):
                 continue
         return False
 
-    async def _verify_cookie(self) -> bool:
-        """启动浏览器加载 cookie，先 positive 后 negative 双重判定。"""
+    async def _verify_cookie(self, browser: Optional[StealthBrowser] = None) -> bool:
+        """在浏览器中加载 cookie，先 positive 后 negative 双重判定。
+
+        未传入 browser 时启动一个临时的 headless 浏览器。
+        """
         try:
             with self.logger.step("verify_cookie"):
-                async with await StealthBrowser.create(headless=True) as browser:
+                if browser is not None:
+                    return await self._verify_cookie_in(browser)
+                async with StealthBrowser(headless=True) as browser:
                     await browser.load_cookies_from_file(self.cookie_file_path)
-                    async with await browser.new_page() as page:
-                        await page.goto(self.publish_url, timeout=30000)
-                        pub_domain = urlparse(self.publish_url).netloc
-                        cur_domain = urlparse(page.url).netloc
-                        # 1) positive 检测优先
-                        authed = await self._check_authed(page)
-                        if authed is True:
-                            self.logger.info("cookie 有效", method="authed_dom")
-                            return True
-                        # 2) negative 检测：登录表单可见 → cookie 失效
-                        if await self._check_login_required(page):
-                            self.logger.warning("cookie 失效", method="login_dom")
-                            return False
-                        # 3) URL 仍在发布域名下 + 无登录表单 → cookie 有效
-                        if pub_domain and cur_domain == pub_domain:
-                            self.logger.info(
-                                "cookie 有效",
-                                method="same_domain",
-                                url=page.url,
-                            )
-                            return True
-                        # 4) 既无 positive 也无 negative：保守判为有效
-                        if authed is None:
-                            self.logger.info("cookie 有效", method="no_login_dom")
-                            return True
-                        self.logger.warning("cookie 状态不明，视为失效")
-                        return False
+                    return await self._verify_cookie_in(browser)
         except Exception as e:
             self.logger.error("verify_cookie 异常", reason=str(e)[:200])
             return False
 
+    async def _verify_cookie_in(self, browser: StealthBrowser) -> bool:
+        async with await browser.new_page() as page:
+            await self._goto_with_retry(page, self.publish_url)
+            pub_domain = urlparse(self.publish_url).netloc
+            cur_domain = urlparse(page.url).netloc
+            # 1) positive 检测优先
+            authed = await self._check_authed(page)
+            if authed is True:
+                self.logger.info("cookie 有效", method="authed_dom")
+                return True
+            # 2) negative 检测：登录表单可见 → cookie 失效
+            if await self._check_login_required(page):
+                self.logger.warning("cookie 失效", method="login_dom")
+                return False
+            # 3) URL 仍在发布域名下 + 无登录表单 → cookie 有效
+            if pub_domain and cur_domain == pub_domain:
+                self.logger.info(
+                    "cookie 有效",
+                    method="same_domain",
+                    url=page.url,
+                )
+                return True
+            # 4) 既无 positive 也无 negative：保守判为有效
+            if authed is None:
+                self.logger.info("cookie 有效", method="no_login_dom")
+                return True
+            self.logger.warning("cookie 状态不明，视为失效")
+            return False
+
     # ------------------------------------------------------------- 通用工具方法
 
     async def _find_first_element(
@@ -508,8 +617,12 @@ class BaseUploader(ABC):
         timeout: float = 60.0,
         interval: float = 1.0,
         desc: str = "condition",
+        wake: Optional[asyncio.Event] = None,
     ) -> bool:
-        """通用轮询：每 interval 秒调用 check()，True 即返回。"""
+        """通用轮询：每 interval 秒调用 check()，True 即返回。
+
+        传入 wake 时，事件被 set 会立即触发下一次 check()，不必等满 interval。
+        """
         deadline = time.monotonic() + timeout
         attempt = 0
         while time.monotonic() < deadline:
@@ -526,7 +639,15 @@ class BaseUploader(ABC):
                     desc=desc,
                     reason=str(e)[:100],
                 )
-            await asyncio.sleep(interval)
+            if wake is None:
+                await asyncio.sleep(interval)
+                continue
+            # check() 期间的事件已体现在本次结果中，清除后再等待新事件
+            wake.clear()
+            try:
+                await asyncio.wait_for(wake.wait(), interval)
+            except asyncio.TimeoutError:
+                pass
         self.logger.warning("wait_for_condition 超时", desc=desc, timeout=timeout)
         return False
 
@@ -558,3 +679,36 @@ class BaseUploader(ABC):
                 return True
             self.logger.error("导航超时且 URL 未匹配", url=current)
             return False
+
+    async def _goto_with_retry(
+        self,
+        page: Page,
+        url: str,
+        *,
+        timeout: int = 30000,
+        attempts: int = _GOTO_ATTEMPTS,
+    ) -> None:
+        """打开页面，超时或网络错误（net::ERR_*）时指数退避重试。
+
+        只用于无副作用的跳转；其他错误（如页面崩溃）直接抛出，最后一次失败也会抛出。
+        """
+        for attempt in range(attempts):
+            try:
+                await page.goto(url, timeout=timeout)
+                return
+            except Error as e:
+                reason = str(e)
+                retryable = isinstance(e, PlaywrightTimeoutError) or (
+                    "net::ERR_" in reason
+                )
+                if not retryable or attempt == attempts - 1:
+                    raise
+                delay = 2**attempt
+                self.logger.warning(
+                    "页面打开失败，稍后重试",
+                    url=url,
+                    attempt=attempt + 1,
+                    delay=delay,
+                    reason=reason[:100],
+                )
+                await asyncio.sleep(delay)
@@ -37,6 +37,7 @@ class PluginLoader:
 
     def __init__(self):
         self._publishers: Dict[str, Type[BasePublisher]] = {}
+        self._display_names: Optional[Dict[str, str]] = None
         self._loaded = False
 
     def load(self) -> None:
@@ -148,15 +149,18 @@ class PluginLoader:
         if not self._loaded:
             self.load()
 
-        result = {}
-        for name, cls in self._publishers.items():
-            try:
-                temp = object.__new__(cls)
-                display = cls.display_name.fget(temp)
-                result[name] = display
-            except Exception:
-                result[name] = name
-        return result
+        # 插件集合只在 load/reload 时变化，映射构建一次后复用
+        if self._display_names is None:
+            result = {}
+            for name, cls in self._publishers.items():
+                try:
+                    temp = object.__new__(cls)
+                    display = cls.display_name.fget(temp)
+                    result[name] = display
+                except Exception:
+                    result[name] = name
+            self._display_names = result
+        return dict(self._display_names)
 
     def list_publisher_names(self) -> List[str]:
         """
@@ -172,6 +176,7 @@ class PluginLoader:
     def reload(self) -> None:
         """重新加载所有插件"""
         self._publishers.clear()
+        self._display_names = None
         self._loaded = False
         self.load()
 
@@ -6,6 +6,9 @@ import re
 from playwright.async_api import Page, Error
 from spreado.core.base_publisher import BasePublisher
 
+# 发布成功后跳转到的作品管理页
+_PUBLISH_SUCCESS_RE = re.compile(r"/content/manage\?enter_from=publish")
+
 
 class DouYinUploader(BasePublisher):
     """
@@ -482,7 +485,7 @@ class DouYinUploader(BasePublisher):
             return await self._click_and_wait_for_url(
                 page,
                 publish_button,
-                re.compile(r"/content/manage\?enter_from=publish"),
+                _PUBLISH_SUCCESS_RE,
                 timeout=30000,
             )
         except Error as e:
@@ -7,6 +7,9 @@ from playwright.async_api import Page, Error
 
 from spreado.core.base_publisher import BasePublisher
 
+# 发布成功后跳转到的作品管理页
+_PUBLISH_SUCCESS_RE = re.compile(r"/article/manage/video\?.*from=publish")
+
 
 class KuaiShouUploader(BasePublisher):
     """
@@ -289,7 +292,6 @@ class KuaiShouUploader(BasePublisher):
             return False
 
     async def _publish_video(self, page: Page) -> bool:
-        success_pattern = re.compile(r"/article/manage/video\?.*from=publish")
         try:
             await self._dismiss_overlays(page)
             # "发布"是自定义 div，用 JS click 最可靠
@@ -317,10 +319,10 @@ class KuaiShouUploader(BasePublisher):
                 pass
             if await confirm_btn.count() > 0 and await confirm_btn.is_visible():
                 return await self._click_and_wait_for_url(
-                    page, confirm_btn, success_pattern, timeout=15000
+                    page, confirm_btn, _PUBLISH_SUCCESS_RE, timeout=15000
                 )
 
-            if success_pattern.search(page.url):
+            if _PUBLISH_SUCCESS_RE.search(page.url):
                 return True
 
             self.logger.error("未找到确认发布按钮")
@@ -16,6 +16,9 @@ from playwright.async_api import Page
 
 from spreado.core.base_publisher import BasePublisher
 
+# 发布成功后跳转到的作品列表页
+_PUBLISH_SUCCESS_RE = re.compile(r"/post/list")
+
 _SHADOW_EVAL = """
 () => {
     const w = document.querySelector('wujie-app');
@@ -442,16 +445,15 @@ class ShiPinHaoUploader(BasePublisher):
                 return False
 
             # 等待跳转到 /post/list（发布成功）
-            pattern = re.compile(r"/post/list")
             deadline = time.monotonic() + 15
             while time.monotonic() < deadline:
-                if pattern.search(page.url):
+                if _PUBLISH_SUCCESS_RE.search(page.url):
                     self.logger.info("视频发布成功")
                     return True
                 await page.wait_for_timeout(1000)
 
             self.logger.warning("发布跳转超时，检查 URL", url=page.url)
-            return bool(pattern.search(page.url))
+            return bool(_PUBLISH_SUCCESS_RE.search(page.url))
 
         except Exception as e:
             self.logger.error("发布异常", reason=str(e)[:200])
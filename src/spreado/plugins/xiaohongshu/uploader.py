@@ -12,6 +12,9 @@ from playwright.async_api import Error, Page
 
 from spreado.core.base_publisher import BasePublisher
 
+# 发布成功后可能跳转到的页面
+_PUBLISH_SUCCESS_RE = re.compile(r"/success|published=true|/content/|/manage")
+
 
 class XiaoHongShuUploader(BasePublisher):
     """小红书视频上传器。"""
@@ -375,7 +378,7 @@ class XiaoHongShuUploader(BasePublisher):
             # 检测发布成功
             async def _check_publish_success() -> bool:
                 cur = page.url
-                if re.search(r"/success|published=true|/content/|/manage", cur):
+                if _PUBLISH_SUCCESS_RE.search(cur):
                     return True
                 for t in ["发布成功", "笔记已发布", "已发布", "审核中"]:
                     if await page.locator(f'text="{t}"').count() > 0:
@@ -1,9 +1,13 @@
+import re
 from datetime import timedelta
 from datetime import datetime
 from pathlib import Path
 
 from ..conf import BASE_DIR
 
+# hashtag 分隔符：中英文逗号或空白
+_TAG_SPLIT_RE = re.compile(r"[,，\s]+")
+
 
 def get_absolute_path(relative_path: str, base_dir: str = None) -> str:
     """
@@ -40,10 +44,7 @@ def get_title_and_hashtags(filename):
     content_text = splite_str[1]
     hashtags = splite_str[2]
 
-    import re
-
-    tags = re.split(r"[,，\s]+", hashtags.strip())
-    tags = [tag for tag in tags if tag]
+    tags = [tag for tag in _TAG_SPLIT_RE.split(hashtags.strip()) if tag]
 
     return title, content_text, tags
 
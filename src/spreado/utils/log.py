@@ -71,10 +71,10 @@ class _FileFormatter(logging.Formatter):
 
 def setup_logging() -> None:
     """初始化根 logger（幂等）。"""
-    LOGS_DIR.mkdir(parents=True, exist_ok=True)
     root = logging.getLogger()
     if getattr(root, "_spreado_configured", False):
         return
+    LOGS_DIR.mkdir(parents=True, exist_ok=True)
     root.setLevel(getattr(logging, LOG_LEVEL.upper(), logging.INFO))
 
     file_h = logging.FileHandler(LOGS_DIR / "uploader.log", mode="a", encoding="utf-8")
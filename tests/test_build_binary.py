@@ -0,0 +1,50 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import build_binary  # noqa: E402
+
+
+@pytest.fixture
+def src_file(tmp_path):
+    src = tmp_path / "src.bin"
+    src.write_bytes(os.urandom(256 * 1024))
+    return src
+
+
+def test_fastcopy_moves_on_when_kernel_copy_returns_zero(
+    tmp_path, src_file, monkeypatch
+):
+    monkeypatch.setattr(os, "copy_file_range", lambda *a: 0, raising=False)
+
+    dst = tmp_path / "dst.bin"
+    build_binary._fastcopy(src_file, dst)
+
+    assert dst.stat().st_size == src_file.stat().st_size
+    assert dst.read_bytes() == src_file.read_bytes()
+
+
+def test_kernel_copy_raises_when_stopped_partway(tmp_path, src_file, monkeypatch):
+    calls = iter([4096, 0])
+    monkeypatch.setattr(os, "copy_file_range", lambda *a: next(calls), raising=False)
+
+    dst = tmp_path / "dst.bin"
+    with open(src_file, "rb") as fsrc, open(dst, "wb") as fdst:
+        with pytest.raises(OSError):
+            build_binary._copy_in_kernel(
+                fsrc.fileno(), fdst.fileno(), src_file.stat().st_size
+            )
+
+
+def test_fastcopy_buffered_fallback_copies_everything(tmp_path, src_file, monkeypatch):
+    monkeypatch.setattr(os, "copy_file_range", lambda *a: 0, raising=False)
+    monkeypatch.setattr(os, "sendfile", lambda *a: 0, raising=False)
+
+    dst = tmp_path / "dst.bin"
+    build_binary._fastcopy(src_file, dst)
+
+    assert dst.read_bytes() == src_file.read_bytes()